@@ -1,19 +1,18 @@
 """Support for tracking the online status of a UPS."""
 from __future__ import annotations
 
-import logging
-
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN, VALUE_ONLINE, APCUPSdData
+from .const import DOMAIN, VALUE_ONLINE
+from .coordinator import APCUPSdCoordinator
 
-_LOGGER = logging.getLogger(__name__)
 _DESCRIPTION = BinarySensorEntityDescription(
     key="statflag",
     name="UPS Online Status",
@@ -27,50 +26,47 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up an APCUPSd Online Status binary sensor."""
-    data_service: APCUPSdData = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: APCUPSdCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     # Do not create the binary sensor if APCUPSd does not provide STATFLAG field for us
     # to determine the online status.
-    if data_service.statflag is None:
+    if coordinator.data.statflag is None:
         return
 
-    async_add_entities(
-        [OnlineStatus(data_service, _DESCRIPTION)],
-        update_before_add=True,
-    )
+    async_add_entities([OnlineStatus(coordinator, _DESCRIPTION)])
 
 
-class OnlineStatus(BinarySensorEntity):
+class OnlineStatus(CoordinatorEntity[APCUPSdCoordinator], BinarySensorEntity):
     """Representation of a UPS online status."""
 
     def __init__(
         self,
-        data_service: APCUPSdData,
+        coordinator: APCUPSdCoordinator,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the APCUPSd binary device."""
+        super().__init__(coordinator)
+
         # Set up unique id and device info if serial number is available.
-        if (serial_no := data_service.serial_no) is not None:
+        if (serial_no := coordinator.data.serial_no) is not None:
             self._attr_unique_id = f"{serial_no}_{description.key}"
-        self._attr_device_info = data_service.device_info
+        self._attr_device_info = coordinator.device_info
 
         self.entity_description = description
-        self._data_service = data_service
+        # The resources from APCUPSd are in upper-case by default.
+        self._status_key = description.key.upper()
+        self._update_attrs()
 
-    def update(self) -> None:
-        """Get the status report from APCUPSd and set this entity's state."""
-        try:
-            self._data_service.update()
-        except OSError as ex:
-            if self._attr_available:
-                self._attr_available = False
-                _LOGGER.exception("Got exception while fetching state: %s", ex)
-            return
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        self.async_write_ha_state()
 
-        self._attr_available = True
-        key = self.entity_description.key.upper()
-        if key not in self._data_service.status:
+    def _update_attrs(self) -> None:
+        """Update the state of the binary sensor from the coordinator data."""
+        if (statflag := self.coordinator.data.get(self._status_key)) is None:
             self._attr_is_on = None
             return
 
-        self._attr_is_on = int(self._data_service.status[key], 16) & VALUE_ONLINE > 0
+        self._attr_is_on = int(statflag, 16) & VALUE_ONLINE > 0
@@ -11,7 +11,8 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
 
-from . import DOMAIN, APCUPSdData
+from .const import DOMAIN
+from .coordinator import get_status
 
 _PORT_SELECTOR = vol.All(
     selector.NumberSelector(
@@ -49,30 +50,31 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         )
 
         # Test the connection to the host and get the current status for serial number.
-        data_service = APCUPSdData(user_input[CONF_HOST], user_input[CONF_PORT])
         try:
-            await self.hass.async_add_executor_job(data_service.update)
+            data = await self.hass.async_add_executor_job(
+                get_status, user_input[CONF_HOST], user_input[CONF_PORT]
+            )
         except OSError:
             errors = {"base": "cannot_connect"}
             return self.async_show_form(
                 step_id="user", data_schema=_SCHEMA, errors=errors
             )
 
-        if not data_service.status:
+        if not data:
             return self.async_abort(reason="no_status")
 
         # We _try_ to use the serial number of the UPS as the unique id since this field
         # is not guaranteed to exist on all APC UPS models.
-        await self.async_set_unique_id(data_service.serial_no)
+        await self.async_set_unique_id(data.serial_no)
         self._abort_if_unique_id_configured()
 
         title = "APC UPS"
-        if data_service.name is not None:
-            title = data_service.name
-        elif data_service.model is not None:
-            title = data_service.model
-        elif data_service.serial_no is not None:
-            title = data_service.serial_no
+        if data.name is not None:
+            title = data.name
+        elif data.model is not None:
+            title = data.model
+        elif data.serial_no is not None:
+            title = data.serial_no
 
         return self.async_create_entry(
             title=title,
@@ -0,0 +1,5 @@
+"""Constants for APCUPSd component."""
+from typing import Final
+
+DOMAIN: Final = "apcupsd"
+VALUE_ONLINE: Final = 8
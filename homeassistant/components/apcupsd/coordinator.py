@@ -0,0 +1,102 @@
+"""Data update coordinator for the APCUPSd integration."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import timedelta
+import logging
+from typing import Final
+
+from apcaccess import status
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+UPDATE_INTERVAL: Final = timedelta(seconds=60)
+
+
+class APCUPSdData(OrderedDict[str, str]):
+    """Store the status retrieved from APCUPSd.
+
+    Note that APCUPSd uses upper case for each resource, where our integration uses
+    lower cases as keys internally.
+    """
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of the UPS, if available."""
+        return self.get("UPSNAME")
+
+    @property
+    def model(self) -> str | None:
+        """Return the model of the UPS, if available."""
+        # Different UPS models may report slightly different keys for model, here we
+        # try them all.
+        for model_key in ("APCMODEL", "MODEL"):
+            if (model := self.get(model_key)) is not None:
+                return model
+        return None
+
+    @property
+    def serial_no(self) -> str | None:
+        """Return the unique serial number of the UPS, if available."""
+        return self.get("SERIALNO")
+
+    @property
+    def statflag(self) -> str | None:
+        """Return the STATFLAG indicating the status of the UPS, if available."""
+        return self.get("STATFLAG")
+
+
+def get_status(host: str, port: int) -> APCUPSdData:
+    """Fetch the latest status from APCUPSd.
+
+    This method performs network I/O and must be run in the executor.
+    """
+    return APCUPSdData(status.parse(status.get(host=host, port=port)))
+
+
+class APCUPSdCoordinator(DataUpdateCoordinator[APCUPSdData]):
+    """Store and coordinate the data retrieved from APCUPSd for all sensors.
+
+    For each entity to use, acts as the single point responsible for fetching
+    updates from the server.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+        """Initialize the coordinator for the APCUPSd server at host:port."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self._host = host
+        self._port = port
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the DeviceInfo of this APC UPS, if serial number is available."""
+        if (serial_no := self.data.serial_no) is None:
+            return None
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, serial_no)},
+            model=self.data.model,
+            manufacturer="APC",
+            name=self.data.name if self.data.name is not None else "APC UPS",
+            hw_version=self.data.get("FIRMWARE"),
+            sw_version=self.data.get("VERSION"),
+        )
+
+    async def _async_update_data(self) -> APCUPSdData:
+        """Fetch the latest status from APCUPSd."""
+        try:
+            return await self.hass.async_add_executor_job(
+                get_status, self._host, self._port
+            )
+        except OSError as error:
+            raise UpdateFailed(error) from error
@@ -1,6 +1,7 @@
 """Support for APCUPSd sensors."""
 from __future__ import annotations
 
+from dataclasses import replace
 import logging
 
 from homeassistant.components.sensor import (
@@ -20,10 +21,12 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN, APCUPSdData
+from .const import DOMAIN
+from .coordinator import APCUPSdCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -411,19 +414,19 @@ SENSORS: dict[str, SensorEntityDescription] = {
         name="UPS Transfer from Battery",
         icon="mdi:transfer",
     ),
-    "xoffbatt": SensorEntityDescription(
-        key="xoffbatt",
-        name="UPS Transfer from Battery",
-        icon="mdi:transfer",
-    ),
     "xonbatt": SensorEntityDescription(
         key="xonbatt",
         name="UPS Transfer to Battery",
         icon="mdi:transfer",
     ),
 }
+# Depending on the version, APCUPSd reports the "Transfer from Battery" field as either
+# "XOFFBAT" or "XOFFBATT", so we alias the latter to the same description (but keep
+# its own key so that the unique ids of existing entities are unchanged).
+SENSORS["xoffbatt"] = replace(SENSORS["xoffbat"], key="xoffbatt")
 
 INFERRED_UNITS = {
+    # The order does not matter, units are matched by suffix length below.
     " Minutes": UnitOfTime.MINUTES,
     " Seconds": UnitOfTime.SECONDS,
     " Percent": PERCENTAGE,
@@ -445,6 +448,16 @@ INFERRED_UNITS = {
     " days": UnitOfTime.DAYS,
 }
 
+# Group the inferred units by suffix length, longest first, so that a unit can be
+# matched with a single dict lookup per distinct length instead of probing every
+# suffix with `str.endswith`.
+_UNITS_BY_LEN: dict[int, dict[str, str]] = {
+    length: {
+        unit: ha_unit for unit, ha_unit in INFERRED_UNITS.items() if len(unit) == length
+    }
+    for length in sorted({len(unit) for unit in INFERRED_UNITS}, reverse=True)
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -452,21 +465,19 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the APCUPSd sensors from config entries."""
-    data_service: APCUPSdData = hass.data[DOMAIN][config_entry.entry_id]
-
-    # The resources from data service are in upper-case by default, but we use
-    # lower cases throughout this integration.
-    available_resources: set[str] = {k.lower() for k, _ in data_service.status.items()}
+    coordinator: APCUPSdCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
-    for resource in available_resources:
-        if resource not in SENSORS:
-            _LOGGER.warning("Invalid resource from APCUPSd: %s", resource.upper())
+    for resource in coordinator.data:
+        # The resources from APCUPSd are in upper-case by default, but we use
+        # lower cases throughout this integration.
+        if (description := SENSORS.get(resource.lower())) is None:
+            _LOGGER.warning("Invalid resource from APCUPSd: %s", resource)
             continue
 
-        entities.append(APCUPSdSensor(data_service, SENSORS[resource]))
+        entities.append(APCUPSdSensor(coordinator, description))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 def infer_unit(value: str) -> tuple[str, str | None]:
@@ -476,48 +487,46 @@ def infer_unit(value: str) -> tuple[str, str | None]:
     pair. Else return the original value and None as the unit.
     """
 
-    for unit, ha_unit in INFERRED_UNITS.items():
-        if value.endswith(unit):
-            return value.removesuffix(unit), ha_unit
+    for length, units in _UNITS_BY_LEN.items():
+        if (ha_unit := units.get(value[-length:])) is not None:
+            return value[:-length], ha_unit
 
     return value, None
 
 
-class APCUPSdSensor(SensorEntity):
+class APCUPSdSensor(CoordinatorEntity[APCUPSdCoordinator], SensorEntity):
     """Representation of a sensor entity for APCUPSd status values."""
 
     def __init__(
         self,
-        data_service: APCUPSdData,
+        coordinator: APCUPSdCoordinator,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(coordinator)
+
         # Set up unique id and device info if serial number is available.
-        if (serial_no := data_service.serial_no) is not None:
+        if (serial_no := coordinator.data.serial_no) is not None:
             self._attr_unique_id = f"{serial_no}_{description.key}"
-        self._attr_device_info = data_service.device_info
+        self._attr_device_info = coordinator.device_info
 
         self.entity_description = description
-        self._data_service = data_service
+        # The resources from APCUPSd are in upper-case by default.
+        self._status_key = description.key.upper()
+        self._update_attrs()
 
-    def update(self) -> None:
-        """Get the latest status and use it to update our sensor state."""
-        try:
-            self._data_service.update()
-        except OSError as ex:
-            if self._attr_available:
-                self._attr_available = False
-                _LOGGER.exception("Got exception while fetching state: %s", ex)
-            return
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        self.async_write_ha_state()
 
-        self._attr_available = True
-        key = self.entity_description.key.upper()
-        if key not in self._data_service.status:
+    def _update_attrs(self) -> None:
+        """Update sensor attributes based on coordinator data."""
+        if (value := self.coordinator.data.get(self._status_key)) is None:
             self._attr_native_value = None
             return
 
-        self._attr_native_value, inferred_unit = infer_unit(
-            self._data_service.status[key]
-        )
+        self._attr_native_value, inferred_unit = infer_unit(value)
         if not self.native_unit_of_measurement:
             self._attr_native_unit_of_measurement = inferred_unit
@@ -72,7 +72,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         quotable = Quotable(hass, config[DOMAIN])
         hass.data[DOMAIN] = quotable
 
-    register_services(hass)
+    register_services(hass, quotable)
 
     return True
 
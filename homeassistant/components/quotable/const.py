@@ -12,6 +12,7 @@ SEARCH_AUTHORS_URL: Final = f"{BASE_URL}/search/authors"
 FETCH_A_QUOTE_URL: Final = f"{BASE_URL}/quotes/random"
 
 HTTP_CLIENT_TIMEOUT: Final = 10
+TAGS_CACHE_MAX_AGE: Final = 3600
 
 SERVICE_FETCH_ALL_TAGS: Final = "fetch_all_tags"
 SERVICE_FETCH_ALL_AUTHORS: Final = "fetch_all_authors"
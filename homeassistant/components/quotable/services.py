@@ -1,12 +1,17 @@
 """Services for the Quotable integration."""
+from __future__ import annotations
 
+import asyncio
 from functools import partial
 from http import HTTPStatus
 import logging
-from typing import Any
+from operator import itemgetter
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import bleach
+from yarl import URL
 
 from homeassistant.core import (
     HomeAssistant,
@@ -15,7 +20,12 @@ from homeassistant.core import (
     SupportsResponse,
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util.json import JsonObjectType
+from homeassistant.util.json import (
+    JsonArrayType,
+    JsonObjectType,
+    json_loads_array,
+    json_loads_object,
+)
 
 from .const import (
     ATTR_AUTHOR,
@@ -44,20 +54,49 @@ from .const import (
     SERVICE_FETCH_ALL_TAGS,
     SERVICE_SEARCH_AUTHORS,
     SERVICE_UPDATE_CONFIGURATION,
+    TAGS_CACHE_MAX_AGE,
 )
 
+if TYPE_CHECKING:
+    from . import Quotable
+
 _LOGGER = logging.getLogger(__name__)
 
+_CLIENT_TIMEOUT = aiohttp.ClientTimeout(total=HTTP_CLIENT_TIMEOUT)
+_NAME_AND_SLUG = itemgetter(ATTR_NAME, ATTR_SLUG)
+
+# Parse the API endpoints once rather than on every request.
+_GET_TAGS_URL = URL(GET_TAGS_URL)
+_GET_AUTHORS_URL = URL(GET_AUTHORS_URL)
+_SEARCH_AUTHORS_URL = URL(SEARCH_AUTHORS_URL)
+_FETCH_A_QUOTE_URL = URL(FETCH_A_QUOTE_URL)
+
+
+class _TagsCache:
+    """Hold the last tags successfully fetched from the Quotable API."""
 
-def register_services(hass: HomeAssistant) -> None:
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.tags: list[dict[str, str]] | None = None
+        self.fetched_at = 0.0
+        self.refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Return whether the cached tags should be refreshed."""
+        return time.monotonic() - self.fetched_at >= TAGS_CACHE_MAX_AGE
+
+
+def register_services(hass: HomeAssistant, quotable: Quotable) -> None:
     """Register services for the Quotable component."""
 
     session = async_get_clientsession(hass)
+    tags_cache = _TagsCache()
 
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_FETCH_ALL_TAGS,
-        service_func=partial(_fetch_all_tags_service, session),
+        service_func=partial(_fetch_all_tags_service, session, hass, tags_cache),
         supports_response=SupportsResponse.ONLY,
     )
 
@@ -78,63 +117,81 @@ def register_services(hass: HomeAssistant) -> None:
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_FETCH_A_QUOTE,
-        service_func=partial(_fetch_a_quote_service, session, hass),
+        service_func=partial(_fetch_a_quote_service, session, hass, quotable),
         supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_UPDATE_CONFIGURATION,
-        service_func=partial(_update_configuration_service, hass),
+        service_func=partial(_update_configuration_service, quotable),
     )
 
 
 async def _fetch_all_tags_service(
-    session: aiohttp.ClientSession, service: ServiceCall
+    session: aiohttp.ClientSession,
+    hass: HomeAssistant,
+    cache: _TagsCache,
+    service: ServiceCall,
 ) -> ServiceResponse:
+    if cache.tags is not None:
+        # The tags rarely change, so serve the cached ones right away and refresh
+        # them in the background once they are stale.
+        if cache.is_stale and cache.refresh_task is None:
+            cache.refresh_task = hass.async_create_background_task(
+                _refresh_tags(session, cache), f"{DOMAIN}_refresh_tags"
+            )
+        return _success_response(cache.tags)
+
     try:
-        response = await session.get(GET_TAGS_URL, timeout=HTTP_CLIENT_TIMEOUT)
-        if response.status == HTTPStatus.OK:
-            tags = await response.json()
-            if tags:
-                tags = [
-                    {
-                        ATTR_NAME: bleach.clean(tag[ATTR_NAME]),
-                        ATTR_SLUG: bleach.clean(tag[ATTR_SLUG]),
-                    }
-                    for tag in tags
-                ]
-                return _success_response(tags)
-
-    except aiohttp.ClientError as err:
+        await _update_tags(session, cache)
+    except (aiohttp.ClientError, ValueError) as err:
         _LOGGER.error(
             "An error occurred while fetching all tags from the Quotable API. Details: %s",
             err,
         )
         return _error_response(ERROR_FETCHING_DATA_FROM_QUOTABLE_API)
 
+    if cache.tags is not None:
+        return _success_response(cache.tags)
+
     _LOGGER.error(ERROR_UNKNOWN)
     return _error_response(ERROR_UNKNOWN)
 
 
+async def _update_tags(session: aiohttp.ClientSession, cache: _TagsCache) -> None:
+    async with session.get(_GET_TAGS_URL, timeout=_CLIENT_TIMEOUT) as response:
+        if response.status == HTTPStatus.OK:
+            # The typed JSON helpers skip the content type check of response.json(),
+            # so callers must treat a non-JSON body (ValueError) as a fetch error.
+            if tags := json_loads_array(await response.read()):
+                cache.tags = _clean_names_and_slugs(tags)
+                cache.fetched_at = time.monotonic()
+
+
+async def _refresh_tags(session: aiohttp.ClientSession, cache: _TagsCache) -> None:
+    try:
+        await _update_tags(session, cache)
+    except (aiohttp.ClientError, ValueError) as err:
+        _LOGGER.warning(
+            "An error occurred while refreshing tags from the Quotable API. Details: %s",
+            err,
+        )
+    finally:
+        cache.refresh_task = None
+
+
 async def _fetch_all_authors_service(
     session: aiohttp.ClientSession, service: ServiceCall
 ) -> ServiceResponse:
     try:
-        response = await session.get(GET_AUTHORS_URL, timeout=HTTP_CLIENT_TIMEOUT)
-        if response.status == HTTPStatus.OK:
-            json = await response.json()
-            if results := json.get("results"):
-                authors = [
-                    {
-                        ATTR_NAME: bleach.clean(result[ATTR_NAME]),
-                        ATTR_SLUG: bleach.clean(result[ATTR_SLUG]),
-                    }
-                    for result in results
-                ]
-                return _success_response(authors)
-
-    except aiohttp.ClientError as err:
+        async with session.get(_GET_AUTHORS_URL, timeout=_CLIENT_TIMEOUT) as response:
+            if response.status == HTTPStatus.OK:
+                json = json_loads_object(await response.read())
+                if (results := json.get("results")) and isinstance(results, list):
+                    return _success_response(_clean_names_and_slugs(results))
+
+    except (aiohttp.ClientError, ValueError) as err:
         _LOGGER.error(
             "An error occurred while fetching all authors from the Quotable API. Details: %s",
             err,
@@ -156,25 +213,17 @@ async def _search_authors_service(
     params = {"query": query, "matchThreshold": 1}
 
     try:
-        response = await session.get(
-            SEARCH_AUTHORS_URL, params=params, timeout=HTTP_CLIENT_TIMEOUT
-        )
+        async with session.get(
+            _SEARCH_AUTHORS_URL, params=params, timeout=_CLIENT_TIMEOUT
+        ) as response:
+            if response.status == HTTPStatus.OK:
+                json = json_loads_object(await response.read())
+                if (results := json.get("results")) and isinstance(results, list):
+                    return _success_response(_clean_names_and_slugs(results))
 
-        if response.status == HTTPStatus.OK:
-            json = await response.json()
-            if results := json.get("results"):
-                authors = [
-                    {
-                        ATTR_NAME: bleach.clean(result[ATTR_NAME]),
-                        ATTR_SLUG: bleach.clean(result[ATTR_SLUG]),
-                    }
-                    for result in results
-                ]
-                return _success_response(authors)
-
-            return _success_response([])
-
-    except aiohttp.ClientError as err:
+                return _success_response([])
+
+    except (aiohttp.ClientError, ValueError) as err:
         _LOGGER.error(
             "An error occurred while searching authors from the Quotable API. Details: %s",
             err,
@@ -186,42 +235,36 @@ async def _search_authors_service(
 
 
 async def _fetch_a_quote_service(
-    session: aiohttp.ClientSession, hass: HomeAssistant, service: ServiceCall
+    session: aiohttp.ClientSession,
+    hass: HomeAssistant,
+    quotable: Quotable,
+    service: ServiceCall,
 ) -> ServiceResponse:
-    """Get the Quotable instance from hass.data."""
-    quotable = hass.data.get(DOMAIN)
-    if quotable is None:
-        return None
-
     selected_tags = quotable.config.get(ATTR_SELECTED_TAGS, [])
     selected_authors = quotable.config.get(ATTR_SELECTED_AUTHORS, [])
 
     params = {
-        "tags": "|".join(tag[ATTR_SLUG] for tag in selected_tags),
-        "author": "|".join(author[ATTR_SLUG] for author in selected_authors),
+        "tags": "|".join([tag[ATTR_SLUG] for tag in selected_tags]),
+        "author": "|".join([author[ATTR_SLUG] for author in selected_authors]),
     }
 
     try:
-        response = await session.get(
-            FETCH_A_QUOTE_URL, params=params, timeout=HTTP_CLIENT_TIMEOUT
-        )
-
-        if response.status == HTTPStatus.OK:
-            quotes = await response.json()
-            if quotes:
-                quote = {
-                    ATTR_AUTHOR: bleach.clean(quotes[0][ATTR_AUTHOR]),
-                    ATTR_CONTENT: bleach.clean(quotes[0][ATTR_CONTENT]),
-                }
+        async with session.get(
+            _FETCH_A_QUOTE_URL, params=params, timeout=_CLIENT_TIMEOUT
+        ) as response:
+            if response.status == HTTPStatus.OK:
+                quotes = json_loads_array(await response.read())
+                if quotes:
+                    quote = _clean_quote(quotes[0])
 
-                hass.bus.async_fire(EVENT_NEW_QUOTE_FETCHED, quote)
+                    hass.bus.async_fire(EVENT_NEW_QUOTE_FETCHED, quote)
 
-                if service.return_response:
-                    return _success_response(quote)
+                    if service.return_response:
+                        return _success_response(quote)
 
-                return None
+                    return None
 
-    except aiohttp.ClientError as err:
+    except (aiohttp.ClientError, ValueError) as err:
         _LOGGER.error(
             "An error occurred while fetching a quote from the Quotable API. Details: %s",
             err,
@@ -233,15 +276,28 @@ async def _fetch_a_quote_service(
 
 
 async def _update_configuration_service(
-    hass: HomeAssistant, service: ServiceCall
+    quotable: Quotable, service: ServiceCall
 ) -> None:
-    if quotable := hass.data.get(DOMAIN):
-        quotable.update_configuration(
-            service.data[ATTR_SELECTED_TAGS],
-            service.data[ATTR_SELECTED_AUTHORS],
-            service.data[ATTR_UPDATE_FREQUENCY],
-            service.data[ATTR_STYLES],
-        )
+    quotable.update_configuration(
+        service.data[ATTR_SELECTED_TAGS],
+        service.data[ATTR_SELECTED_AUTHORS],
+        service.data[ATTR_UPDATE_FREQUENCY],
+        service.data[ATTR_STYLES],
+    )
+
+
+def _clean_names_and_slugs(items: JsonArrayType) -> list[dict[str, str]]:
+    return [
+        {ATTR_NAME: bleach.clean(name), ATTR_SLUG: bleach.clean(slug)}
+        for name, slug in map(_NAME_AND_SLUG, items)
+    ]
+
+
+def _clean_quote(quote: Any) -> dict[str, str]:
+    return {
+        ATTR_AUTHOR: bleach.clean(quote[ATTR_AUTHOR]),
+        ATTR_CONTENT: bleach.clean(quote[ATTR_CONTENT]),
+    }
 
 
 def _success_response(data: Any) -> JsonObjectType:
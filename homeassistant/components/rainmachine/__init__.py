@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import timedelta
-from functools import partial, wraps
+from functools import partial
+from itertools import islice
+import time
+from types import MappingProxyType
 from typing import Any
 
 from regenmaschine import Client
@@ -33,7 +36,6 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
-from homeassistant.util.dt import as_timestamp, utcnow
 from homeassistant.util.network import is_ip_address
 
 from .config_flow import get_client_controller
@@ -87,12 +89,14 @@ CONF_WEATHER = "weather"
 CONF_WIND = "wind"
 
 # Config Validator for Flow Meter Data
-CV_FLOW_METER_VALID_UNITS = {
-    "clicks",
-    "gal",
-    "litre",
-    "m3",
-}
+CV_FLOW_METER_VALID_UNITS = frozenset(
+    {
+        "clicks",
+        "gal",
+        "litre",
+        "m3",
+    }
+)
 
 # Config Validators for Weather Service Data
 CV_WX_DATA_VALID_PERCENTAGE = vol.All(vol.Coerce(int), vol.Range(min=0, max=100))
@@ -156,15 +160,43 @@ SERVICE_RESTRICT_WATERING_SCHEMA = SERVICE_SCHEMA.extend(
     }
 )
 
-COORDINATOR_UPDATE_INTERVAL_MAP = {
-    DATA_API_VERSIONS: timedelta(minutes=1),
-    DATA_MACHINE_FIRMWARE_UPDATE_STATUS: timedelta(seconds=15),
-    DATA_PROGRAMS: timedelta(seconds=30),
-    DATA_PROVISION_SETTINGS: timedelta(minutes=1),
-    DATA_RESTRICTIONS_CURRENT: timedelta(minutes=1),
-    DATA_RESTRICTIONS_UNIVERSAL: timedelta(minutes=1),
-    DATA_ZONES: timedelta(seconds=15),
-}
+COORDINATOR_UPDATE_INTERVAL_MAP: Mapping[str, timedelta] = MappingProxyType(
+    {
+        DATA_API_VERSIONS: timedelta(minutes=1),
+        DATA_MACHINE_FIRMWARE_UPDATE_STATUS: timedelta(seconds=15),
+        DATA_PROGRAMS: timedelta(seconds=30),
+        DATA_PROVISION_SETTINGS: timedelta(minutes=1),
+        DATA_RESTRICTIONS_CURRENT: timedelta(minutes=1),
+        DATA_RESTRICTIONS_UNIVERSAL: timedelta(minutes=1),
+        DATA_ZONES: timedelta(seconds=15),
+    }
+)
+
+# Firmware only gains API calls through an update (and the reboot that comes with
+# it), so there is no point in polling an unsupported category at its usual pace:
+UNSUPPORTED_API_CATEGORY_UPDATE_INTERVAL = timedelta(days=1)
+
+API_CATEGORY_REQUESTS: Mapping[
+    str, Callable[[Controller], Awaitable[dict]]
+] = MappingProxyType(
+    {
+        DATA_API_VERSIONS: lambda controller: controller.api.versions(),
+        DATA_MACHINE_FIRMWARE_UPDATE_STATUS: lambda controller: (
+            controller.machine.get_firmware_update_status()
+        ),
+        DATA_PROGRAMS: lambda controller: controller.programs.all(
+            include_inactive=True
+        ),
+        DATA_PROVISION_SETTINGS: lambda controller: controller.provisioning.settings(),
+        DATA_RESTRICTIONS_CURRENT: lambda controller: controller.restrictions.current(),
+        DATA_RESTRICTIONS_UNIVERSAL: lambda controller: (
+            controller.restrictions.universal()
+        ),
+        DATA_ZONES: lambda controller: controller.zones.all(
+            details=True, include_inactive=True
+        ),
+    }
+)
 
 
 @dataclass
@@ -173,6 +205,9 @@ class RainMachineData:
 
     controller: Controller
     coordinators: dict[str, RainMachineDataUpdateCoordinator]
+    device_info: DeviceInfo
+    unique_id_prefix: str
+    unsupported_api_categories: set[str]
 
 
 @callback
@@ -206,13 +241,123 @@ async def async_update_programs_and_zones(
     data: RainMachineData = hass.data[DOMAIN][entry.entry_id]
 
     await asyncio.gather(
-        *[
-            data.coordinators[DATA_PROGRAMS].async_refresh(),
-            data.coordinators[DATA_ZONES].async_refresh(),
-        ]
+        data.coordinators[DATA_PROGRAMS].async_request_refresh(),
+        data.coordinators[DATA_ZONES].async_request_refresh(),
+    )
+
+
+async def _async_dispatch_service(
+    hass: HomeAssistant,
+    func: Callable[[ServiceCall, Controller], Awaitable[None]],
+    update_programs_and_zones: bool,
+    call: ServiceCall,
+) -> None:
+    """Run a service handler against the controller targeted by the call."""
+    entry = async_get_entry_for_service_call(hass, call)
+    data: RainMachineData = hass.data[DOMAIN][entry.entry_id]
+
+    try:
+        await func(call, data.controller)
+    except RainMachineError as err:
+        raise HomeAssistantError(
+            f"Error while executing {func.__name__}: {err}"
+        ) from err
+
+    if update_programs_and_zones:
+        await async_update_programs_and_zones(hass, entry)
+
+
+async def async_pause_watering(call: ServiceCall, controller: Controller) -> None:
+    """Pause watering for a set number of seconds."""
+    await controller.watering.pause_all(call.data[CONF_SECONDS])
+
+
+async def async_push_flow_meter_data(call: ServiceCall, controller: Controller) -> None:
+    """Push flow meter data to the device."""
+    value = call.data[CONF_VALUE]
+    if units := call.data.get(CONF_UNIT_OF_MEASUREMENT):
+        await controller.watering.post_flowmeter(value=value, units=units)
+    else:
+        await controller.watering.post_flowmeter(value=value)
+
+
+async def async_push_weather_data(call: ServiceCall, controller: Controller) -> None:
+    """Push weather data to the device."""
+    weather_data = dict(call.data)
+    weather_data.pop(CONF_DEVICE_ID)
+    await controller.parsers.post_data({CONF_WEATHER: [weather_data]})
+
+
+async def async_restrict_watering(call: ServiceCall, controller: Controller) -> None:
+    """Restrict watering for a time period."""
+    duration = call.data[CONF_DURATION]
+    await controller.restrictions.set_universal(
+        {
+            "rainDelayStartTime": round(time.time()),
+            "rainDelayDuration": duration.total_seconds(),
+        },
+    )
+
+
+async def async_stop_all(call: ServiceCall, controller: Controller) -> None:
+    """Stop all watering."""
+    await controller.watering.stop_all()
+
+
+async def async_unpause_watering(call: ServiceCall, controller: Controller) -> None:
+    """Unpause watering."""
+    await controller.watering.unpause_all()
+
+
+async def async_unrestrict_watering(call: ServiceCall, controller: Controller) -> None:
+    """Unrestrict watering."""
+    await controller.restrictions.set_universal(
+        {
+            "rainDelayStartTime": round(time.time()),
+            "rainDelayDuration": 0,
+        },
     )
 
 
+_SERVICE_DEFS: tuple[
+    tuple[str, vol.Schema, Callable[[ServiceCall, Controller], Awaitable[None]], bool],
+    ...,
+] = (
+    (
+        SERVICE_NAME_PAUSE_WATERING,
+        SERVICE_PAUSE_WATERING_SCHEMA,
+        async_pause_watering,
+        True,
+    ),
+    (
+        SERVICE_NAME_PUSH_FLOW_METER_DATA,
+        SERVICE_PUSH_FLOW_METER_DATA_SCHEMA,
+        async_push_flow_meter_data,
+        False,
+    ),
+    (
+        SERVICE_NAME_PUSH_WEATHER_DATA,
+        SERVICE_PUSH_WEATHER_DATA_SCHEMA,
+        async_push_weather_data,
+        False,
+    ),
+    (
+        SERVICE_NAME_RESTRICT_WATERING,
+        SERVICE_RESTRICT_WATERING_SCHEMA,
+        async_restrict_watering,
+        True,
+    ),
+    (SERVICE_NAME_STOP_ALL, SERVICE_SCHEMA, async_stop_all, True),
+    (SERVICE_NAME_UNPAUSE_WATERING, SERVICE_SCHEMA, async_unpause_watering, True),
+    (
+        SERVICE_NAME_UNRESTRICT_WATERING,
+        SERVICE_SCHEMA,
+        async_unrestrict_watering,
+        True,
+    ),
+)
+
+
 async def async_setup_entry(  # noqa: C901
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
@@ -240,17 +385,16 @@ async def async_setup_entry(  # noqa: C901
         # If the config entry doesn't already have a unique ID, set one:
         entry_updates["unique_id"] = controller.mac
 
+    options = dict(entry.options)
     if CONF_DEFAULT_ZONE_RUN_TIME in entry.data:
         # If a zone run time exists in the config entry's data, pop it and move it to
         # options:
-        data = {**entry.data}
+        data = dict(entry.data)
+        options[CONF_DEFAULT_ZONE_RUN_TIME] = data.pop(CONF_DEFAULT_ZONE_RUN_TIME)
         entry_updates["data"] = data
-        entry_updates["options"] = {
-            **entry.options,
-            CONF_DEFAULT_ZONE_RUN_TIME: data.pop(CONF_DEFAULT_ZONE_RUN_TIME),
-        }
-    if CONF_USE_APP_RUN_TIMES not in entry.options:
-        entry_updates["options"] = {**entry.options, CONF_USE_APP_RUN_TIMES: False}
+    options.setdefault(CONF_USE_APP_RUN_TIMES, False)
+    if options != entry.options:
+        entry_updates["options"] = options
     if entry_updates:
         hass.config_entries.async_update_entry(entry, **entry_updates)
 
@@ -265,47 +409,38 @@ async def async_setup_entry(  # noqa: C901
             f"found {controller.mac}"
         )
 
+    unsupported_api_categories: set[str] = set()
+
     async def async_update(api_category: str) -> dict:
         """Update the appropriate API data based on a category."""
-        data: dict = {}
-
+        coordinator = coordinators[api_category]
         try:
-            if api_category == DATA_API_VERSIONS:
-                data = await controller.api.versions()
-            elif api_category == DATA_MACHINE_FIRMWARE_UPDATE_STATUS:
-                data = await controller.machine.get_firmware_update_status()
-            elif api_category == DATA_PROGRAMS:
-                data = await controller.programs.all(include_inactive=True)
-            elif api_category == DATA_PROVISION_SETTINGS:
-                data = await controller.provisioning.settings()
-            elif api_category == DATA_RESTRICTIONS_CURRENT:
-                data = await controller.restrictions.current()
-            elif api_category == DATA_RESTRICTIONS_UNIVERSAL:
-                data = await controller.restrictions.universal()
-            else:
-                data = await controller.zones.all(details=True, include_inactive=True)
+            data = await API_CATEGORY_REQUESTS[api_category](controller)
         except UnknownAPICallError:
-            LOGGER.info(
-                "Skipping unsupported API call for controller %s: %s",
-                controller.name,
-                api_category,
-            )
+            if api_category not in unsupported_api_categories:
+                LOGGER.info(
+                    "Skipping unsupported API call for controller %s: %s",
+                    controller.name,
+                    api_category,
+                )
+                unsupported_api_categories.add(api_category)
+                coordinator.update_interval = UNSUPPORTED_API_CATEGORY_UPDATE_INTERVAL
         except RainMachineError as err:
             raise UpdateFailed(err) from err
+        else:
+            if api_category in unsupported_api_categories:
+                # The controller supports the call again (e.g., after a firmware
+                # update), so go back to the regular polling interval:
+                unsupported_api_categories.remove(api_category)
+                coordinator.update_interval = COORDINATOR_UPDATE_INTERVAL_MAP[
+                    api_category
+                ]
+            return data
 
-        return data
+        return {}
 
-    async def async_init_coordinator(
-        coordinator: RainMachineDataUpdateCoordinator,
-    ) -> None:
-        """Initialize a RainMachineDataUpdateCoordinator."""
-        await coordinator.async_initialize()
-        await coordinator.async_config_entry_first_refresh()
-
-    controller_init_tasks = []
-    coordinators = {}
-    for api_category, update_interval in COORDINATOR_UPDATE_INTERVAL_MAP.items():
-        coordinator = coordinators[api_category] = RainMachineDataUpdateCoordinator(
+    coordinators = {
+        api_category: RainMachineDataUpdateCoordinator(
             hass,
             entry=entry,
             name=f'{controller.name} ("{api_category}")',
@@ -313,145 +448,53 @@ async def async_setup_entry(  # noqa: C901
             update_interval=update_interval,
             update_method=partial(async_update, api_category),
         )
-        controller_init_tasks.append(async_init_coordinator(coordinator))
+        for api_category, update_interval in COORDINATOR_UPDATE_INTERVAL_MAP.items()
+    }
 
-    await asyncio.gather(*controller_init_tasks)
+    await asyncio.gather(
+        *(coordinator.async_initialize() for coordinator in coordinators.values())
+    )
+    await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in coordinators.values()
+        )
+    )
 
     hass.data.setdefault(DOMAIN, {})
+    version_data = coordinators[DATA_API_VERSIONS].data
     hass.data[DOMAIN][entry.entry_id] = RainMachineData(
-        controller=controller, coordinators=coordinators
+        controller=controller,
+        coordinators=coordinators,
+        # Every entity of this controller shares one device and unique ID prefix:
+        device_info=DeviceInfo(
+            identifiers={(DOMAIN, controller.mac)},
+            configuration_url=(
+                f"https://{entry.data[CONF_IP_ADDRESS]}:{entry.data[CONF_PORT]}"
+            ),
+            connections={(dr.CONNECTION_NETWORK_MAC, controller.mac)},
+            name=controller.name.capitalize(),
+            manufacturer="RainMachine",
+            model=f"Version {version_data['hwVer']} (API: {version_data['apiVer']})",
+            sw_version=version_data["swVer"],
+        ),
+        unique_id_prefix=f"{controller.mac}_",
+        unsupported_api_categories=unsupported_api_categories,
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    def call_with_controller(update_programs_and_zones: bool = True) -> Callable:
-        """Hydrate a service call with the appropriate controller."""
-
-        def decorator(func: Callable) -> Callable[..., Awaitable]:
-            """Define the decorator."""
-
-            @wraps(func)
-            async def wrapper(call: ServiceCall) -> None:
-                """Wrap the service function."""
-                entry = async_get_entry_for_service_call(hass, call)
-                data: RainMachineData = hass.data[DOMAIN][entry.entry_id]
-
-                try:
-                    await func(call, data.controller)
-                except RainMachineError as err:
-                    raise HomeAssistantError(
-                        f"Error while executing {func.__name__}: {err}"
-                    ) from err
-
-                if update_programs_and_zones:
-                    await async_update_programs_and_zones(hass, entry)
-
-            return wrapper
-
-        return decorator
-
-    @call_with_controller()
-    async def async_pause_watering(call: ServiceCall, controller: Controller) -> None:
-        """Pause watering for a set number of seconds."""
-        await controller.watering.pause_all(call.data[CONF_SECONDS])
-
-    @call_with_controller(update_programs_and_zones=False)
-    async def async_push_flow_meter_data(
-        call: ServiceCall, controller: Controller
-    ) -> None:
-        """Push flow meter data to the device."""
-        value = call.data[CONF_VALUE]
-        if units := call.data.get(CONF_UNIT_OF_MEASUREMENT):
-            await controller.watering.post_flowmeter(value=value, units=units)
-        else:
-            await controller.watering.post_flowmeter(value=value)
-
-    @call_with_controller(update_programs_and_zones=False)
-    async def async_push_weather_data(
-        call: ServiceCall, controller: Controller
-    ) -> None:
-        """Push weather data to the device."""
-        await controller.parsers.post_data(
-            {
-                CONF_WEATHER: [
-                    {
-                        key: value
-                        for key, value in call.data.items()
-                        if key != CONF_DEVICE_ID
-                    }
-                ]
-            }
-        )
-
-    @call_with_controller()
-    async def async_restrict_watering(
-        call: ServiceCall, controller: Controller
-    ) -> None:
-        """Restrict watering for a time period."""
-        duration = call.data[CONF_DURATION]
-        await controller.restrictions.set_universal(
-            {
-                "rainDelayStartTime": round(as_timestamp(utcnow())),
-                "rainDelayDuration": duration.total_seconds(),
-            },
-        )
-
-    @call_with_controller()
-    async def async_stop_all(call: ServiceCall, controller: Controller) -> None:
-        """Stop all watering."""
-        await controller.watering.stop_all()
-
-    @call_with_controller()
-    async def async_unpause_watering(call: ServiceCall, controller: Controller) -> None:
-        """Unpause watering."""
-        await controller.watering.unpause_all()
-
-    @call_with_controller()
-    async def async_unrestrict_watering(
-        call: ServiceCall, controller: Controller
-    ) -> None:
-        """Unrestrict watering."""
-        await controller.restrictions.set_universal(
-            {
-                "rainDelayStartTime": round(as_timestamp(utcnow())),
-                "rainDelayDuration": 0,
-            },
-        )
-
-    for service_name, schema, method in (
-        (
-            SERVICE_NAME_PAUSE_WATERING,
-            SERVICE_PAUSE_WATERING_SCHEMA,
-            async_pause_watering,
-        ),
-        (
-            SERVICE_NAME_PUSH_FLOW_METER_DATA,
-            SERVICE_PUSH_FLOW_METER_DATA_SCHEMA,
-            async_push_flow_meter_data,
-        ),
-        (
-            SERVICE_NAME_PUSH_WEATHER_DATA,
-            SERVICE_PUSH_WEATHER_DATA_SCHEMA,
-            async_push_weather_data,
-        ),
-        (
-            SERVICE_NAME_RESTRICT_WATERING,
-            SERVICE_RESTRICT_WATERING_SCHEMA,
-            async_restrict_watering,
-        ),
-        (SERVICE_NAME_STOP_ALL, SERVICE_SCHEMA, async_stop_all),
-        (SERVICE_NAME_UNPAUSE_WATERING, SERVICE_SCHEMA, async_unpause_watering),
-        (
-            SERVICE_NAME_UNRESTRICT_WATERING,
-            SERVICE_SCHEMA,
-            async_unrestrict_watering,
-        ),
-    ):
+    for service_name, schema, method, update_programs_and_zones in _SERVICE_DEFS:
         if hass.services.has_service(DOMAIN, service_name):
             continue
-        hass.services.async_register(DOMAIN, service_name, method, schema=schema)
+        hass.services.async_register(
+            DOMAIN,
+            service_name,
+            partial(_async_dispatch_service, hass, method, update_programs_and_zones),
+            schema=schema,
+        )
 
     return True
 
@@ -462,23 +505,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    loaded_entries = [
-        entry
-        for entry in hass.config_entries.async_entries(DOMAIN)
-        if entry.state == ConfigEntryState.LOADED
-    ]
+    # Stop looking once a second loaded entry turns up:
+    loaded_entries = list(
+        islice(
+            (
+                entry
+                for entry in hass.config_entries.async_entries(DOMAIN)
+                if entry.state == ConfigEntryState.LOADED
+            ),
+            2,
+        )
+    )
     if len(loaded_entries) == 1:
         # If this is the last loaded instance of RainMachine, deregister any services
         # defined during integration setup:
-        for service_name in (
-            SERVICE_NAME_PAUSE_WATERING,
-            SERVICE_NAME_PUSH_FLOW_METER_DATA,
-            SERVICE_NAME_PUSH_WEATHER_DATA,
-            SERVICE_NAME_RESTRICT_WATERING,
-            SERVICE_NAME_STOP_ALL,
-            SERVICE_NAME_UNPAUSE_WATERING,
-            SERVICE_NAME_UNRESTRICT_WATERING,
-        ):
+        for service_name, *_ in _SERVICE_DEFS:
             hass.services.async_remove(DOMAIN, service_name)
 
     return unload_ok
@@ -534,31 +575,12 @@ class RainMachineEntity(CoordinatorEntity[RainMachineDataUpdateCoordinator]):
         """Initialize."""
         super().__init__(data.coordinators[description.api_category])
 
-        self._attr_extra_state_attributes = {}
-        self._attr_unique_id = f"{data.controller.mac}_{description.key}"
+        self._attr_unique_id = data.unique_id_prefix + description.key
         self._entry = entry
         self._data = data
         self._version_coordinator = data.coordinators[DATA_API_VERSIONS]
         self.entity_description = description
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this controller."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._data.controller.mac)},
-            configuration_url=(
-                f"https://{self._entry.data[CONF_IP_ADDRESS]}:"
-                f"{self._entry.data[CONF_PORT]}"
-            ),
-            connections={(dr.CONNECTION_NETWORK_MAC, self._data.controller.mac)},
-            name=self._data.controller.name.capitalize(),
-            manufacturer="RainMachine",
-            model=(
-                f"Version {self._version_coordinator.data['hwVer']} "
-                f"(API: {self._version_coordinator.data['apiVer']})"
-            ),
-            sw_version=self._version_coordinator.data["swVer"],
-        )
+        self._attr_device_info = data.device_info
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -381,15 +381,13 @@ class RainMachineProgram(RainMachineActivitySwitch):
                 "%Y-%m-%d %H:%M",
             ).isoformat()
 
-        self._attr_extra_state_attributes.update(
-            {
-                ATTR_ID: self.entity_description.uid,
-                ATTR_NEXT_RUN: next_run,
-                ATTR_SOAK: data.get("soak"),
-                ATTR_STATUS: RUN_STATE_MAP[data["status"]],
-                ATTR_ZONES: [z for z in data["wateringTimes"] if z["active"]],
-            }
-        )
+        self._attr_extra_state_attributes = {
+            ATTR_ID: self.entity_description.uid,
+            ATTR_NEXT_RUN: next_run,
+            ATTR_SOAK: data.get("soak"),
+            ATTR_STATUS: RUN_STATE_MAP[data["status"]],
+            ATTR_ZONES: [z for z in data["wateringTimes"] if z["active"]],
+        }
 
 
 class RainMachineProgramEnabled(RainMachineEnabledSwitch):
@@ -519,7 +517,7 @@ class RainMachineZone(RainMachineActivitySwitch):
                     list(self.coordinator.data).index(self.entity_description.uid)
                 ]
 
-        self._attr_extra_state_attributes.update(attrs)
+        self._attr_extra_state_attributes = attrs
 
 
 class RainMachineZoneEnabled(RainMachineEnabledSwitch):
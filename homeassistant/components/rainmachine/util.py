@@ -10,6 +10,7 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -18,6 +19,10 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import LOGGER
 
+# Coalesce bursts of refresh requests (e.g., several watering service calls in a row)
+# and give the controller a moment to apply changes before we read them back:
+REQUEST_REFRESH_COOLDOWN = 1.5
+
 SIGNAL_REBOOT_COMPLETED = "rainmachine_reboot_completed_{0}"
 SIGNAL_REBOOT_REQUESTED = "rainmachine_reboot_requested_{0}"
 
@@ -106,6 +111,9 @@ class RainMachineDataUpdateCoordinator(DataUpdateCoordinator[dict]):
             name=name,
             update_interval=update_interval,
             update_method=update_method,
+            request_refresh_debouncer=Debouncer(
+                hass, LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
             always_update=False,
         )
 
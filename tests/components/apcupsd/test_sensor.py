@@ -1,5 +1,11 @@
 """Test sensors of APCUPSd integration."""
+from datetime import timedelta
+from unittest.mock import patch
 
+import pytest
+
+from homeassistant.components.apcupsd.coordinator import UPDATE_INTERVAL
+from homeassistant.components.apcupsd.sensor import infer_unit
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
     SensorDeviceClass,
@@ -9,15 +15,21 @@ from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
     PERCENTAGE,
+    STATE_UNAVAILABLE,
+    UnitOfApparentPower,
     UnitOfElectricPotential,
     UnitOfPower,
+    UnitOfTemperature,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.dt import utcnow
 
 from . import MOCK_STATUS, async_init_integration
 
+from tests.common import async_fire_time_changed
+
 
 async def test_sensor(hass: HomeAssistant) -> None:
     """Test states of sensor."""
@@ -105,3 +117,55 @@ async def test_sensor_disabled(hass: HomeAssistant) -> None:
 
     assert updated_entry != entry
     assert updated_entry.disabled is False
+
+
+async def test_state_update(hass: HomeAssistant) -> None:
+    """Ensure the sensor state changes after updating the data."""
+    await async_init_integration(hass)
+
+    state = hass.states.get("sensor.ups_load")
+    assert state
+    assert state.state == "14.0"
+
+    future = utcnow() + timedelta(minutes=2)
+    with patch("apcaccess.status.parse") as mock_parse, patch(
+        "apcaccess.status.get", return_value=b""
+    ):
+        mock_parse.return_value = MOCK_STATUS | {"LOADPCT": "15.0 Percent"}
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.ups_load")
+        assert state
+        assert state.state == "15.0"
+
+    # All sensors must become unavailable when the data can no longer be fetched.
+    future += UPDATE_INTERVAL + timedelta(seconds=1)
+    with patch("apcaccess.status.parse", side_effect=OSError()), patch(
+        "apcaccess.status.get"
+    ):
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+        state = hass.states.get("sensor.ups_load")
+        assert state
+        assert state.state == STATE_UNAVAILABLE
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("124.0 Volts", ("124.0", UnitOfElectricPotential.VOLT)),
+        ("34.6 C Internal", ("34.6", UnitOfTemperature.CELSIUS)),
+        ("34.6 C", ("34.6", UnitOfTemperature.CELSIUS)),
+        ("83 Percent Load Capacity", ("83", PERCENTAGE)),
+        ("100.0 Percent", ("100.0", PERCENTAGE)),
+        ("60.0 VA", ("60.0", UnitOfApparentPower.VOLT_AMPERE)),
+        ("7 days", ("7", UnitOfTime.DAYS)),
+        ("Stand Alone", ("Stand Alone", None)),
+        ("C", ("C", None)),
+    ],
+)
+def test_infer_unit(value: str, expected: tuple[str, str | None]) -> None:
+    """Test that units are split off the end of the reported values."""
+    assert infer_unit(value) == expected
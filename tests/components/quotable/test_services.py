@@ -1,7 +1,9 @@
 """Test the Quotable integration services."""
-
+from datetime import timedelta
+from unittest.mock import patch
 
 import aiohttp
+from freezegun.api import FrozenDateTimeFactory
 
 from homeassistant.components.quotable.const import (
     ATTR_AUTHOR,
@@ -30,6 +32,7 @@ from homeassistant.components.quotable.const import (
     SERVICE_SEARCH_AUTHORS,
     SERVICE_UPDATE_CONFIGURATION,
 )
+from homeassistant.components.quotable.services import _TagsCache
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -68,6 +71,26 @@ async def test_fetch_all_tags_service_returns_error_response_when_exception_is_t
     assert service_response.get(ATTR_ERROR) == ERROR_FETCHING_DATA_FROM_QUOTABLE_API
 
 
+async def test_fetch_all_tags_service_returns_error_response_for_non_json_body(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """The fetch_all_tags service must return an error response when the Quotable API responds with a body that is not JSON."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    await hass.async_block_till_done()
+
+    aioclient_mock.get(GET_TAGS_URL, text="<html>Service Unavailable</html>")
+
+    service_response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FETCH_ALL_TAGS,
+        blocking=True,
+        return_response=True,
+    )
+
+    assert not service_response.get(ATTR_SUCCESS)
+    assert service_response.get(ATTR_ERROR) == ERROR_FETCHING_DATA_FROM_QUOTABLE_API
+
+
 async def test_fetch_all_tags_service_success_response(
     hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
 ) -> None:
@@ -102,6 +125,60 @@ async def test_fetch_all_tags_service_success_response(
     assert response.get(ATTR_DATA) == mock_tags
 
 
+async def test_fetch_all_tags_service_serves_cached_tags(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The fetch_all_tags service must serve cached tags and refresh them in the background once stale."""
+    tags_cache = _TagsCache()
+    with patch(
+        "homeassistant.components.quotable.services._TagsCache",
+        return_value=tags_cache,
+    ):
+        assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+        await hass.async_block_till_done()
+
+    mock_tags = [{ATTR_NAME: "Love", ATTR_SLUG: "love"}]
+    aioclient_mock.get(GET_TAGS_URL, json=mock_tags)
+
+    for _ in range(2):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_FETCH_ALL_TAGS,
+            blocking=True,
+            return_response=True,
+        )
+        assert response.get(ATTR_DATA) == mock_tags
+    assert aioclient_mock.call_count == 1
+
+    aioclient_mock.clear_requests()
+    new_tags = [{ATTR_NAME: "Peace", ATTR_SLUG: "peace"}]
+    aioclient_mock.get(GET_TAGS_URL, json=new_tags)
+    freezer.tick(timedelta(hours=2))
+
+    # Stale tags are still served while they are refreshed in the background.
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FETCH_ALL_TAGS,
+        blocking=True,
+        return_response=True,
+    )
+    assert response.get(ATTR_DATA) == mock_tags
+    assert tags_cache.refresh_task is not None
+    await tags_cache.refresh_task
+    assert aioclient_mock.call_count == 1
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FETCH_ALL_TAGS,
+        blocking=True,
+        return_response=True,
+    )
+    assert response.get(ATTR_DATA) == new_tags
+    assert aioclient_mock.call_count == 1
+
+
 async def test_fetch_all_authors_service_returns_error_response_when_exception_is_thrown(
     hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
 ) -> None:
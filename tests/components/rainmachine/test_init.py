@@ -0,0 +1,182 @@
+"""Test RainMachine setup."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from regenmaschine.errors import RainMachineError, UnknownAPICallError
+
+from homeassistant.components.rainmachine import (
+    CONF_VALUE,
+    COORDINATOR_UPDATE_INTERVAL_MAP,
+    DOMAIN,
+    SERVICE_NAME_PUSH_FLOW_METER_DATA,
+    SERVICE_NAME_STOP_ALL,
+    UNSUPPORTED_API_CATEGORY_UPDATE_INTERVAL,
+)
+from homeassistant.components.rainmachine.const import (
+    CONF_DEFAULT_ZONE_RUN_TIME,
+    CONF_USE_APP_RUN_TIMES,
+    DATA_MACHINE_FIRMWARE_UPDATE_STATUS,
+)
+from homeassistant.components.rainmachine.util import REQUEST_REFRESH_COOLDOWN
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
+
+
+@pytest.fixture(name="config_entry")
+def config_entry_fixture(hass, config, config_entry, zone_run_time):
+    """Define a config entry fixture with an optional legacy zone run time."""
+    if zone_run_time is not None:
+        hass.config_entries.async_update_entry(
+            config_entry, data={**config, CONF_DEFAULT_ZONE_RUN_TIME: zone_run_time}
+        )
+    return config_entry
+
+
+@pytest.fixture(name="controller")
+def controller_fixture(controller, firmware_update_status_side_effect):
+    """Define a regenmaschine controller with an optional firmware status error."""
+    controller.machine.get_firmware_update_status.side_effect = (
+        firmware_update_status_side_effect
+    )
+    return controller
+
+
+@pytest.fixture(name="device_entry")
+def device_entry_fixture(hass, config_entry, controller_mac):
+    """Define the device of the controller."""
+    return dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={(DOMAIN, controller_mac)},
+    )
+
+
+@pytest.fixture(name="firmware_update_status_side_effect")
+def firmware_update_status_side_effect_fixture():
+    """Define a side effect for fetching the firmware update status."""
+    return None
+
+
+@pytest.fixture(name="zone_run_time")
+def zone_run_time_fixture():
+    """Define a zone run time stored in the config entry data."""
+    return None
+
+
+@pytest.mark.parametrize("zone_run_time", [300])
+async def test_migrate_zone_run_time_to_options(
+    hass: HomeAssistant, config_entry, setup_rainmachine
+) -> None:
+    """Test that a zone run time in the entry data moves to the options."""
+    assert CONF_DEFAULT_ZONE_RUN_TIME not in config_entry.data
+    assert config_entry.options == {
+        CONF_DEFAULT_ZONE_RUN_TIME: 300,
+        CONF_USE_APP_RUN_TIMES: False,
+    }
+
+
+@pytest.mark.parametrize(
+    "firmware_update_status_side_effect", [UnknownAPICallError("Unknown API call")]
+)
+async def test_unsupported_api_category_polling(
+    hass: HomeAssistant, config_entry, controller, setup_rainmachine
+) -> None:
+    """Test that an unsupported API category is polled less often until it works."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = data.coordinators[DATA_MACHINE_FIRMWARE_UPDATE_STATUS]
+    assert coordinator.data == {}
+    assert coordinator.update_interval == UNSUPPORTED_API_CATEGORY_UPDATE_INTERVAL
+    assert data.unsupported_api_categories == {DATA_MACHINE_FIRMWARE_UPDATE_STATUS}
+
+    # The controller starts supporting the call (e.g., after a firmware update):
+    controller.machine.get_firmware_update_status.side_effect = None
+    await coordinator.async_refresh()
+
+    assert coordinator.data == (
+        controller.machine.get_firmware_update_status.return_value
+    )
+    assert coordinator.update_interval == (
+        COORDINATOR_UPDATE_INTERVAL_MAP[DATA_MACHINE_FIRMWARE_UPDATE_STATUS]
+    )
+    assert not data.unsupported_api_categories
+
+
+async def test_services(
+    hass: HomeAssistant, config_entry, controller, device_entry, setup_rainmachine
+) -> None:
+    """Test that services reach the controller of the targeted device."""
+    with patch(
+        "homeassistant.components.rainmachine.async_update_programs_and_zones",
+        AsyncMock(),
+    ) as mock_update_programs_and_zones:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_NAME_STOP_ALL,
+            {CONF_DEVICE_ID: device_entry.id},
+            blocking=True,
+        )
+        controller.watering.stop_all.assert_awaited_once()
+        mock_update_programs_and_zones.assert_awaited_once_with(hass, config_entry)
+
+        # Pushing flow meter data does not change programs or zones:
+        mock_update_programs_and_zones.reset_mock()
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_NAME_PUSH_FLOW_METER_DATA,
+            {CONF_DEVICE_ID: device_entry.id, CONF_VALUE: 1.5},
+            blocking=True,
+        )
+        controller.watering.post_flowmeter.assert_awaited_once_with(value=1.5)
+        mock_update_programs_and_zones.assert_not_awaited()
+
+        # Controller errors name the failing handler and skip the refresh:
+        controller.watering.stop_all.side_effect = RainMachineError("Boom")
+        with pytest.raises(HomeAssistantError, match="async_stop_all: Boom"):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_NAME_STOP_ALL,
+                {CONF_DEVICE_ID: device_entry.id},
+                blocking=True,
+            )
+        mock_update_programs_and_zones.assert_not_awaited()
+
+    with pytest.raises(ValueError, match="Invalid RainMachine device ID"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_NAME_STOP_ALL,
+            {CONF_DEVICE_ID: "unknown"},
+            blocking=True,
+        )
+
+
+async def test_services_debounce_program_and_zone_refresh(
+    hass: HomeAssistant, controller, device_entry, setup_rainmachine
+) -> None:
+    """Test that back-to-back service calls refresh programs and zones once."""
+    controller.programs.all.reset_mock()
+    controller.zones.all.reset_mock()
+
+    for _ in range(2):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_NAME_STOP_ALL,
+            {CONF_DEVICE_ID: device_entry.id},
+            blocking=True,
+        )
+
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    controller.programs.all.assert_not_awaited()
+    controller.zones.all.assert_not_awaited()
+
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=REQUEST_REFRESH_COOLDOWN)
+    )
+    await hass.async_block_till_done()
+    controller.programs.all.assert_awaited_once()
+    controller.zones.all.assert_awaited_once()